@@ -1,4 +1,5 @@
 from .mona_openai import (
+    flush_pending_log_tasks,
     monitor,
     monitor_with_logger,
     get_rest_monitor,
@@ -8,3 +9,4 @@ from .mona_openai import (
 )
 from .exceptions import *
 from .loggers import *
+from .util.async_util import enable_uvloop
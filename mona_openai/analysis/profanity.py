@@ -1,15 +1,22 @@
 """
 Logic to create profanity analysis.
+
+NOTE: profanity_check is imported lazily since it pulls in
+scikit-learn, which takes substantial time to import and isn't needed
+at all when profanity analysis is disabled.
 """
 from collections.abc import Iterable
-from profanity_check import predict_prob, predict
 
 _DECIMAL_PLACES = 2
 
 
 def get_profanity_prob(texts: Iterable[str]) -> tuple[float, ...]:
+    from profanity_check import predict_prob
+
     return tuple(round(x, _DECIMAL_PLACES) for x in predict_prob(texts))
 
 
 def get_has_profanity(texts: Iterable[str]) -> tuple[bool, ...]:
+    from profanity_check import predict
+
     return tuple(bool(x) for x in predict(texts))
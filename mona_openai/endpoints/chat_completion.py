@@ -1,7 +1,6 @@
 """
 The Mona wrapping code for OpenAI's ChatCompletion API.
 """
-from copy import deepcopy
 from functools import wraps
 
 from ..util.oop_util import create_combined_object
@@ -66,16 +65,38 @@ class ChatCompletionWrapping(OpenAIEndpointWrappingLogic):
         example the actual texts, to avoid sending such information, that
         is sometimes sensitive, to Mona.
         """
-        new_message = deepcopy(message)
+        # We avoid deepcopying the whole message (which contains the
+        # full response) and instead create new dicts just for the
+        # parts we remove data from, without mutating the original.
+        new_message = dict(message)
         if not self._specs.get("export_prompt", False):
-            for input_message in new_message["input"]["messages"]:
-                input_message.pop("content", None)
+            new_input = dict(message["input"])
+            new_input["messages"] = [
+                {
+                    key: value
+                    for key, value in input_message.items()
+                    if key != "content"
+                }
+                for input_message in new_input["messages"]
+            ]
+            new_message["input"] = new_input
 
         if "response" in message and not self._specs.get(
             "export_response_texts", False
         ):
-            for choice in new_message["response"]["choices"]:
-                choice["message"].pop("content", None)
+            new_response = dict(message["response"])
+            new_response["choices"] = [
+                choice
+                | {
+                    "message": {
+                        key: value
+                        for key, value in choice["message"].items()
+                        if key != "content"
+                    }
+                }
+                for choice in new_response["choices"]
+            ]
+            new_message["response"] = new_response
 
         return new_message
 
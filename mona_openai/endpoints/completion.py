@@ -1,7 +1,6 @@
 """
 The Mona wrapping code for OpenAI's Completion API.
 """
-from copy import deepcopy
 from functools import wraps
 
 from ..analysis.privacy import get_privacy_analyzers, PrivacyAnalyzer
@@ -53,15 +52,30 @@ class CompletionWrapping(OpenAIEndpointWrappingLogic):
         example the actual texts, to avoid sending such information, that
         is sometimes sensitive, to Mona.
         """
-        new_message = deepcopy(message)
+        # We avoid deepcopying the whole message (which contains the
+        # full response) and instead create new dicts just for the
+        # parts we remove data from, without mutating the original.
+        new_message = dict(message)
         if not self._specs.get("export_prompt", False):
-            new_message["input"].pop("prompt", None)
+            new_message["input"] = {
+                key: value
+                for key, value in message["input"].items()
+                if key != "prompt"
+            }
 
         if "response" in message and not self._specs.get(
             "export_response_texts", False
         ):
-            for choice in new_message["response"]["choices"]:
-                choice.pop("text", None)
+            new_response = dict(message["response"])
+            new_response["choices"] = [
+                {
+                    key: value
+                    for key, value in choice.items()
+                    if key != "text"
+                }
+                for choice in new_response["choices"]
+            ]
+            new_message["response"] = new_response
 
         return new_message
 
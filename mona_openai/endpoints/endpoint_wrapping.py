@@ -2,6 +2,7 @@
 A module for general logic for wrapping OpenAI endpoints.
 """
 import abc
+from ..util.general_consts import EMPTY_DICT
 from ..util.validation_util import validate_openai_class
 
 from ..util.typing_util import SupportedOpenAIClassesType
@@ -25,6 +26,14 @@ class OpenAIEndpointWrappingLogic(metaclass=abc.ABCMeta):
             "textual": self._get_full_textual_analysis,
             "profanity": self._get_full_profainty_analysis,
         }
+        # Resolve which analysis types are enabled once here, instead
+        # of consulting the specs on every analyzed call.
+        analysis_specs = specs.get("analysis", EMPTY_DICT)
+        self._enabled_analysis_functions = tuple(
+            (name, function)
+            for name, function in self._analysis_functions.items()
+            if analysis_specs.get(name, True)
+        )
 
     def wrap_class(self, openai_class) -> SupportedOpenAIClassesType:
         """
@@ -60,9 +69,11 @@ class OpenAIEndpointWrappingLogic(metaclass=abc.ABCMeta):
             def _get_all_response_texts(cls, response: Mapping) -> Iterable[str]:
                 return self.get_all_response_texts(response)
 
-        return type(
-            f"Monitored{self._get_endpoint_name()}", (WrapperClass,), {}
-        )
+        # Rename in place instead of deriving yet another subclass,
+        # which would only deepen the MRO for every super() call.
+        WrapperClass.__name__ = f"Monitored{self._get_endpoint_name()}"
+        WrapperClass.__qualname__ = WrapperClass.__name__
+        return WrapperClass
 
     @abc.abstractmethod
     def _get_endpoint_name(self) -> str:
@@ -92,9 +103,8 @@ class OpenAIEndpointWrappingLogic(metaclass=abc.ABCMeta):
             category.
         """
         return {
-            x: self._analysis_functions[x](input, response)
-            for x in self._analysis_functions
-            if self._specs.get("analysis", {}).get(x, True)
+            name: function(input, response)
+            for name, function in self._enabled_analysis_functions
         }
 
     @abc.abstractmethod
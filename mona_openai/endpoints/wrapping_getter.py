@@ -1,6 +1,7 @@
 from .completion import CompletionWrapping, COMPLETION_CLASS_NAME
 from .chat_completion import ChatCompletionWrapping, CHAT_COMPLETION_CLASS_NAME
 from ..exceptions import WrongOpenAIClassException
+from ..util.mapping_util import freeze_mapping
 from collections.abc import Mapping
 
 # TODO(Itai): This is essetially a nice-looking "switch" statement. We should
@@ -11,11 +12,30 @@ ENDPOINT_NAME_TO_WRAPPING = {
     CHAT_COMPLETION_CLASS_NAME: ChatCompletionWrapping,
 }
 
+# Wrapping-logic instances hold no per-call state - just their specs
+# and the setup derived from them (e.g., enabled analysis functions) -
+# so the ones for the known endpoint names are built once per specs and
+# reused across monitor calls.
+_WRAPPING_CACHE: dict = {}
+
 
 def get_endpoint_wrapping(endpoint_name: str, specs: Mapping):
     try:
-        return ENDPOINT_NAME_TO_WRAPPING[endpoint_name](specs)
+        wrapping_class = ENDPOINT_NAME_TO_WRAPPING[endpoint_name]
     except KeyError:
         raise WrongOpenAIClassException(
             f"Not a supported class name: {endpoint_name}"
         )
+
+    frozen_specs = freeze_mapping(specs)
+    if frozen_specs is None:
+        # Unhashable specs can't serve as a cache key.
+        return wrapping_class(specs)
+
+    cache_key = (endpoint_name, frozen_specs)
+    wrapping = _WRAPPING_CACHE.get(cache_key)
+    if wrapping is None:
+        wrapping = _WRAPPING_CACHE.setdefault(
+            cache_key, wrapping_class(specs)
+        )
+    return wrapping
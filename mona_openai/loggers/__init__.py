@@ -1,4 +1,5 @@
 from .logger import Logger
+from .background_logger import BackgroundLogger
 from .in_memory_logging import InMemoryLogger
 from .standard_logging import StandardLogger
 from .file_logger import FileLogger
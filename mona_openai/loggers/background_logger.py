@@ -0,0 +1,117 @@
+from .logger import Logger
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Optional
+from collections.abc import Mapping
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_MAX_BATCH_LATENCY_SECONDS = 0.1
+
+
+class BackgroundLogger(Logger):
+    """
+    A logger that wraps any other logger and moves the actual logging
+    work off the calling thread.
+
+    Messages are handed to a bounded in-memory queue, and a background
+    daemon thread drains the queue in batches (up to a size or time
+    limit) into the wrapped logger's "log_batch". This keeps the
+    wrapped logger's round-trip (e.g., a network export) off the
+    monitored call's critical path.
+
+    When the queue is full, the oldest queued message is dropped to
+    make room, and the total number of drops is counted under
+    "dropped_count".
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_latency_seconds: float = (
+            DEFAULT_MAX_BATCH_LATENCY_SECONDS
+        ),
+    ):
+        self._logger = logger
+        self._max_batch_size = max_batch_size
+        self._max_batch_latency_seconds = max_batch_latency_seconds
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self.dropped_count = 0
+
+        threading.Thread(
+            target=self._consume,
+            name="mona-openai-log-writer",
+            daemon=True,
+        ).start()
+
+        atexit.register(self.flush)
+
+    def start_monitoring(self, openai_class_name: str):
+        return self._logger.start_monitoring(openai_class_name)
+
+    def log(
+        self,
+        message: Mapping,
+        context_id: Optional[str] = None,
+        export_timestamp: Optional[float] = None,
+    ) -> None:
+        entry = (message, context_id, export_timestamp)
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            # Drop the oldest queued message to make room for the new
+            # one, keeping the caller non-blocked.
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+            except queue.Empty:
+                pass
+            self.dropped_count += 1
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                self.dropped_count += 1
+
+    async def alog(
+        self,
+        message: Mapping,
+        context_id: Optional[str] = None,
+        export_timestamp: Optional[float] = None,
+    ) -> None:
+        self.log(message, context_id, export_timestamp)
+
+    def flush(self) -> None:
+        """
+        Blocks until every message queued so far has been handed to the
+        wrapped logger. Call this before shutting down to make sure no
+        monitoring data is lost.
+        """
+        self._queue.join()
+
+    def _consume(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_batch_latency_seconds
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            try:
+                self._logger.log_batch(batch)
+            except Exception:
+                # A failing logger shouldn't kill the writer thread (or
+                # ever propagate back to monitored calls).
+                logging.exception("Mona logger failed to log a batch")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
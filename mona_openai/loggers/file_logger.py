@@ -1,6 +1,6 @@
 from .logger import Logger
+from ..util.json_util import json_dumps
 import atexit
-import json
 from typing import Optional
 from collections.abc import Mapping
 
@@ -22,7 +22,7 @@ class FileLogger(Logger):
     def log(self, message: Mapping, context_id: Optional[str]=None, export_timestamp: Optional[float]=None) -> None:
         self.file.writelines(
             [
-                json.dumps(
+                json_dumps(
                     {
                         "message": message,
                         "context_id": context_id,
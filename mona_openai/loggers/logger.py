@@ -34,6 +34,17 @@ class Logger(metaclass=abc.ABCMeta):
         """
         pass
 
+    def log_batch(self, entries) -> None:
+        """
+        Logs a batch of (message, context_id, export_timestamp) tuples.
+
+        By default each entry is just logged individually - child
+        classes whose backing store supports bulk writes may override
+        this with a more efficient implementation.
+        """
+        for message, context_id, export_timestamp in entries:
+            self.log(message, context_id, export_timestamp)
+
     @abc.abstractmethod
     async def alog(
         self, message: Mapping, context_id: Optional[str]=None, export_timestamp: Optional[float]=None
@@ -1,20 +1,24 @@
+import asyncio
+import logging
 import time
+from weakref import WeakValueDictionary
 from .loggers.mona_logger.mona_logger import MonaLogger
 from .loggers.logger import Logger
-from copy import deepcopy
 from typing import Optional
 from collections.abc import Callable, Mapping
 from .util.general_consts import EMPTY_DICT
 from .util.typing_util import SupportedOpenAIClassesType
 
+from random import random
+
 from .exceptions import InvalidLagnchainLLMException
 from .endpoints.wrapping_getter import get_endpoint_wrapping
 from .loggers.mona_logger.mona_client import get_mona_clients
-from .util.func_util import add_conditional_sampling
 from .util.async_util import (
     run_in_an_event_loop,
     call_non_blocking_sync_or_async,
 )
+from .util.mapping_util import freeze_mapping
 from .util.openai_util import get_model_param
 from .util.tokens_util import get_usage
 from .util.stream_util import ResponseGatheringIterator
@@ -27,35 +31,243 @@ CONTEXT_ID_ARG_NAME = MONA_ARGS_PREFIX + "context_id"
 EXPORT_TIMESTAMP_ARG_NAME = MONA_ARGS_PREFIX + "export_timestamp"
 ADDITIONAL_DATA_ARG_NAME = MONA_ARGS_PREFIX + "additional_data"
 
+# The full, known, set of Mona-specific argument names. Filtering with
+# this frozenset (using dict-keys set arithmetic) is cheaper than a
+# startswith check on every key of every call.
+_MONA_KEYS = frozenset(
+    (
+        CONTEXT_ID_ARG_NAME,
+        EXPORT_TIMESTAMP_ARG_NAME,
+        ADDITIONAL_DATA_ARG_NAME,
+    )
+)
+
+
+def _filter_mona_args(kwargs: Mapping, _mona_keys=_MONA_KEYS) -> dict:
+    """
+    Returns a new dict with all Mona-specific arguments removed.
+    """
+    return {key: kwargs[key] for key in kwargs.keys() - _mona_keys}
+
+
+# Caches monitored classes per (openai class, logger, specs), both to
+# avoid re-creating classes (which would leak when monitor() is called
+# repeatedly, e.g. per-request in some frameworks) and to skip redundant
+# monitoring re-initialization.
+_MONITORED_CLASS_CACHE: WeakValueDictionary = WeakValueDictionary()
+
+
+# Log-export tasks that were scheduled in the background instead of
+# being awaited on the calling request's critical path (used with the
+# "non_blocking_logging" spec).
+_PENDING_LOG_TASKS: set = set()
+
+
+async def flush_pending_log_tasks() -> None:
+    """
+    Awaits all log exports currently scheduled in the background (only
+    relevant when the "non_blocking_logging" spec is used). Call this
+    before shutting down your event loop to make sure no monitoring
+    data is lost.
+    """
+    if _PENDING_LOG_TASKS:
+        # A failed export shouldn't propagate out of the flush and
+        # abandon the remaining tasks - log it and keep draining.
+        results = await asyncio.gather(
+            *tuple(_PENDING_LOG_TASKS), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logging.error(
+                    "Mona log export failed during flush: %r", result
+                )
+
+
+class _CallContext:
+    """
+    Holds the state of a single create/acreate call for monitoring
+    purposes.
+
+    The per-call logging logic lives on this class as regular methods,
+    which are created once at import time, instead of as closures inside
+    "_inner_create", which would have to be re-allocated (functions,
+    cells and all) on every single API call.
+    """
+
+    __slots__ = (
+        "monitored_class",
+        "export_function",
+        "super_function",
+        "args",
+        "kwargs",
+        "filtered_kwargs",
+        "specs",
+        "is_async",
+        "start_time",
+        "export_timestamp",
+        "stream_start_time",
+        "response",
+        "sampling_ratio",
+    )
+
+    def __init__(
+        self,
+        monitored_class: type,
+        export_function: Callable,
+        super_function: Callable,
+        args: tuple,
+        kwargs: Mapping,
+        specs: Mapping,
+        is_async: bool,
+        sampling_ratio: float,
+    ):
+        self.monitored_class = monitored_class
+        self.export_function = export_function
+        self.super_function = super_function
+        self.args = args
+        self.kwargs = kwargs
+        # Compute the Mona-args-free kwargs once for both the actual
+        # OpenAI call and the logging message.
+        self.filtered_kwargs = _filter_mona_args(kwargs)
+        self.specs = specs
+        self.is_async = is_async
+
+        # Will be set only once a response is received, and, when
+        # streaming is enabled, only once the stream is done.
+        self.response: Optional[Mapping] = None
+
+        # Will be used only when stream is enabled. Monotonic
+        # nanoseconds, like start_time.
+        self.stream_start_time: Optional[int] = None
+
+        self.sampling_ratio = sampling_ratio
+
+        # Wall-clock time is kept only for the default export timestamp.
+        # Latency is measured with the monotonic clock, which can't go
+        # backwards (e.g., on NTP adjustments) and is cheaper to read.
+        self.export_timestamp = time.time()
+        self.start_time = time.monotonic_ns()
+
+    async def log_message(self, is_exception: bool):
+        # When the user opts in to non-blocking logging, schedule the
+        # export as a background task instead of awaiting the logger's
+        # round-trip on the request's critical path. This is only safe
+        # in the async flow, where the caller's event loop outlives this
+        # call.
+        if self.is_async and self.specs.get("non_blocking_logging", False):
+            task = asyncio.create_task(self._export_log_message(is_exception))
+            _PENDING_LOG_TASKS.add(task)
+            task.add_done_callback(_PENDING_LOG_TASKS.discard)
+            return None
+
+        return await self._export_log_message(is_exception)
+
+    async def _export_log_message(
+        self,
+        is_exception: bool,
+        # Bound as default args to avoid global lookups per call.
+        _context_id_key=CONTEXT_ID_ARG_NAME,
+        _export_timestamp_key=EXPORT_TIMESTAMP_ARG_NAME,
+    ):
+        # Consult the sampling RNG before anything else, so that
+        # sampled-out calls don't pay for building the logging message
+        # (input copy, analysis, etc.) at all.
+        if self.sampling_ratio < 1 and random() >= self.sampling_ratio:
+            return None
+
+        response = self.response
+        kwargs = self.kwargs
+        return await call_non_blocking_sync_or_async(
+            self.export_function,
+            (
+                self.monitored_class._get_logging_message(
+                    kwargs,
+                    self.filtered_kwargs,
+                    self.start_time,
+                    is_exception,
+                    self.is_async,
+                    self.stream_start_time,
+                    response,
+                ),
+                kwargs.get(
+                    _context_id_key,
+                    response["id"] if response else None,
+                ),
+                kwargs.get(_export_timestamp_key, self.export_timestamp),
+            ),
+        )
+
+    async def call_super(self):
+        """
+        Calls the actual openai create function without the Mona
+        specific arguments.
+        """
+        return await call_non_blocking_sync_or_async(
+            self.super_function, self.args, self.filtered_kwargs
+        )
+
+    async def handle_exception(self):
+        if not self.specs.get("avoid_monitoring_exceptions", False):
+            await self.log_message(True)
+
+    async def stream_done_callback(
+        self, final_response, actual_stream_start_time
+    ):
+        monitored_class = self.monitored_class
+        # There is no usage data in returned stream responses, so we add
+        # it here. The final response dict is created by the gathering
+        # iterator just for this callback, so it can be updated in place
+        # instead of being copied.
+        final_response["usage"] = get_usage(
+            model=get_model_param(self.kwargs),
+            prompt_texts=monitored_class._get_all_prompt_texts(self.kwargs),
+            response_texts=monitored_class._get_all_response_texts(
+                final_response
+            ),
+        )
+        self.response = final_response
+        self.stream_start_time = actual_stream_start_time
+        await self.log_message(False)
+
 
 def _get_logging_message(
     api_name: str,
     request_input: Mapping,
-    start_time: float,
+    start_time: int,
     is_exception: bool,
     is_async: bool,
-    stream_start_time: Optional[float],
+    stream_start_time: Optional[int],
     response: Optional[Mapping],
     analysis_getter: Callable[[Mapping, Mapping], dict],
     message_cleaner: Callable[[Mapping], dict],
     additional_data: Mapping,
+    # Bound as a default arg to make the hot-path clock read a local
+    # lookup instead of a global one.
+    _monotonic_ns: Callable[[], int] = time.monotonic_ns,
 ) -> dict:
     """
     Returns a dict object containing all the monitoring analysis to be used
     for data logging.
     """
 
+    # Latency times are monotonic nanoseconds (immune to wall-clock
+    # jumps), converted to seconds only here when building the message.
+    # Optional fields are only inserted when actually present, so
+    # non-stream calls never carry (and never have to strip) None
+    # values.
     message = {
         "input": request_input,
-        "latency": time.time() - start_time,
-        "stream_start_latency": stream_start_time - start_time
-        if stream_start_time is not None
-        else None,
+        "latency": (_monotonic_ns() - start_time) / 1e9,
         "is_exception": is_exception,
         "api_name": api_name,
         "is_async": is_async,
     }
 
+    if stream_start_time is not None:
+        message["stream_start_latency"] = (
+            stream_start_time - start_time
+        ) / 1e9
+
     if additional_data:
         message["additional_data"] = additional_data
 
@@ -143,9 +355,24 @@ def monitor_with_logger(openai_class, logger, specs=EMPTY_DICT):
 
     sampling_ratio = validate_and_get_sampling_ratio(specs)
 
-    base_class = get_endpoint_wrapping(
-        openai_class.__name__, specs
-    ).wrap_class(openai_class)
+    frozen_specs = freeze_mapping(specs)
+    cache_key = (
+        (openai_class, id(logger), frozen_specs)
+        if frozen_specs is not None
+        else None
+    )
+    if cache_key is not None:
+        cached_class = _MONITORED_CLASS_CACHE.get(cache_key)
+        if cached_class is not None:
+            return cached_class
+
+    wrapping_logic = get_endpoint_wrapping(openai_class.__name__, specs)
+    base_class = wrapping_logic.wrap_class(openai_class)
+
+    # Resolve the analysis and cleaning callables once here, instead of
+    # walking the MRO with super() on every logged call.
+    analysis_getter = wrapping_logic.get_full_analysis
+    message_cleaner = wrapping_logic.get_clean_message
 
     logger.start_monitoring(openai_class.__name__)
 
@@ -158,39 +385,35 @@ def monitor_with_logger(openai_class, logger, specs=EMPTY_DICT):
         def _get_logging_message(
             cls,
             kwargs_param: Mapping,
-            start_time: float,
+            filtered_kwargs: Mapping,
+            start_time: int,
             is_exception: bool,
             is_async: bool,
-            stream_start_time: float,
+            stream_start_time: Optional[int],
             response: Mapping,
         ) -> dict:
             """
             Returns a dict to be used for data logging.
             """
-            # Recreate the input dict to avoid manipulating the caller's data,
-            # and remove Mona-related data.
-            request_input = deepcopy(
-                {
-                    x: kwargs_param[x]
-                    for x in kwargs_param
-                    if not x.startswith(MONA_ARGS_PREFIX)
-                }
-            )
-
+            # The filtered kwargs top-level dict is already created
+            # fresh per call, and everything downstream of it (the
+            # analyzers, the message cleaners, the loggers'
+            # serialization) only reads the data, so no isolation copy
+            # of the caller's nested data is needed.
             additional_data: Mapping = kwargs_param.get(
                 ADDITIONAL_DATA_ARG_NAME, EMPTY_DICT
             )
 
             return _get_logging_message(
                 api_name=openai_class.__name__,
-                request_input=request_input,
+                request_input=filtered_kwargs,
                 start_time=start_time,
                 is_exception=is_exception,
                 is_async=is_async,
                 stream_start_time=stream_start_time,
                 response=response,
-                analysis_getter=super()._get_full_analysis,
-                message_cleaner=super()._get_clean_message,
+                analysis_getter=analysis_getter,
+                message_cleaner=message_cleaner,
                 additional_data=additional_data,
             )
 
@@ -201,6 +424,7 @@ def monitor_with_logger(openai_class, logger, specs=EMPTY_DICT):
             super_function: Callable,
             args,
             kwargs,
+            is_async: bool,
         ):
             """
             The main logic for wrapping create functions with monitoring data
@@ -210,103 +434,41 @@ def monitor_with_logger(openai_class, logger, specs=EMPTY_DICT):
             and "acreate").
             """
 
-            is_stream = kwargs.get("stream", False)
-            is_async = super_function.__name__ == "acreate"
-
-            response = None
-
-            # will be used only when stream is enabled
-            stream_start_time = None
-
-            async def _inner_log_message(is_exception):
-                return await call_non_blocking_sync_or_async(
-                    export_function,
-                    (
-                        cls._get_logging_message(
-                            kwargs,
-                            start_time,
-                            is_exception,
-                            is_async,
-                            stream_start_time,
-                            response,
-                        ),
-                        kwargs.get(
-                            CONTEXT_ID_ARG_NAME,
-                            response["id"] if response else None,
-                        ),
-                        kwargs.get(EXPORT_TIMESTAMP_ARG_NAME, start_time),
-                    ),
-                )
-
-            log_message = add_conditional_sampling(
-                _inner_log_message, sampling_ratio
+            ctx = _CallContext(
+                monitored_class=cls,
+                export_function=export_function,
+                super_function=super_function,
+                args=args,
+                kwargs=kwargs,
+                specs=specs,
+                is_async=is_async,
+                sampling_ratio=sampling_ratio,
             )
 
-            start_time = time.time()
-
-            async def inner_super_function():
-                # Call the actual openai create function without the Mona
-                # specific arguments.
-                return await call_non_blocking_sync_or_async(
-                    super_function,
-                    args,
-                    {
-                        x: kwargs[x]
-                        for x in kwargs
-                        if not x.startswith(MONA_ARGS_PREFIX)
-                    },
-                )
-
-            async def inner_handle_exception():
-                if not specs.get("avoid_monitoring_exceptions", False):
-                    await log_message(True)
-
-            if not is_stream:
+            if not kwargs.get("stream", False):
                 try:
-                    response = await inner_super_function()
+                    ctx.response = await ctx.call_super()
                 except Exception:
-                    await inner_handle_exception()
+                    await ctx.handle_exception()
                     raise
 
-                await log_message(False)
+                await ctx.log_message(False)
 
-                return response
+                return ctx.response
 
             # From here it's stream handling.
-
-            async def _stream_done_callback(
-                final_response, actual_stream_start_time
-            ):
-                nonlocal response
-                nonlocal stream_start_time
-                # There is no usage data in returned stream responses, so
-                # we add it here.
-                response = final_response | {
-                    "usage": get_usage(
-                        model=get_model_param(kwargs),
-                        prompt_texts=base_class._get_all_prompt_texts(kwargs),
-                        response_texts=base_class._get_all_response_texts(
-                            final_response
-                        ),
-                    )
-                }
-                stream_start_time = actual_stream_start_time
-                await log_message(False)
-
             try:
-                # Call the actual openai create function without the Mona
-                # specific arguments.
                 return ResponseGatheringIterator(
-                    original_iterator=await inner_super_function(),
+                    original_iterator=await ctx.call_super(),
                     delta_choice_text_getter=(
-                        base_class._get_stream_delta_text_from_choice
+                        cls._get_stream_delta_text_from_choice
                     ),
-                    final_choice_getter=base_class._get_final_choice,
-                    callback=_stream_done_callback,
+                    final_choice_getter=cls._get_final_choice,
+                    callback=ctx.stream_done_callback,
                 )
 
             except Exception:
-                await inner_handle_exception()
+                await ctx.handle_exception()
                 raise
 
         @classmethod
@@ -316,7 +478,9 @@ def monitor_with_logger(openai_class, logger, specs=EMPTY_DICT):
             function.
             """
             return run_in_an_event_loop(
-                cls._inner_create(logger.log, super().create, args, kwargs)
+                cls._inner_create(
+                    logger.log, super().create, args, kwargs, is_async=False
+                )
             )
 
         @classmethod
@@ -326,10 +490,19 @@ def monitor_with_logger(openai_class, logger, specs=EMPTY_DICT):
             "acreate" function.
             """
             return await cls._inner_create(
-                logger.alog, super().acreate, args, kwargs
+                logger.alog, super().acreate, args, kwargs, is_async=True
             )
 
-    return type(base_class.__name__, (MonitoredOpenAI,), {})
+    # Rename in place instead of deriving yet another subclass - an
+    # extra inheritance layer would only deepen the MRO walked on every
+    # super() call.
+    MonitoredOpenAI.__name__ = base_class.__name__
+    MonitoredOpenAI.__qualname__ = base_class.__name__
+
+    if cache_key is not None:
+        _MONITORED_CLASS_CACHE[cache_key] = MonitoredOpenAI
+
+    return MonitoredOpenAI
 
 
 def get_rest_monitor(
@@ -389,7 +562,7 @@ def get_rest_monitor_with_logger(
             """
             Actual logic for logging requests, responses and exceptions.
             """
-            start_time = time.time()
+            start_time = time.monotonic_ns()
 
             if additional_data is None:
                 additional_data = EMPTY_DICT
@@ -399,6 +572,12 @@ def get_rest_monitor_with_logger(
                 more_additional_data: Mapping,
                 response: Optional[Mapping] = None,
             ):
+                # Consult the sampling RNG before anything else, so
+                # that sampled-out calls don't pay for building the
+                # logging message at all.
+                if sampling_ratio < 1 and random() >= sampling_ratio:
+                    return None
+
                 return message_logging_function(
                     _get_logging_message(
                         api_name=openai_endpoint_name,
@@ -411,19 +590,18 @@ def get_rest_monitor_with_logger(
                         response=response,
                         analysis_getter=wrapping_logic.get_full_analysis,
                         message_cleaner=wrapping_logic.get_clean_message,
-                        additional_data={
-                            **additional_data,
-                            **more_additional_data,
-                        },
+                        # Skip the merge (two dict copies) in the
+                        # common case of no call-specific data.
+                        additional_data=(
+                            {**additional_data, **more_additional_data}
+                            if more_additional_data
+                            else additional_data
+                        ),
                     ),
                     context_id,
                     export_timestamp,
                 )
 
-            log_message = add_conditional_sampling(
-                _inner_log_message, sampling_ratio
-            )
-
             def log_response(
                 response: Mapping, additional_data: Mapping = EMPTY_DICT
             ):
@@ -434,14 +612,16 @@ def get_rest_monitor_with_logger(
                 possible to when it is received to allow accurate
                 latency logging.
                 """
-                return log_message(
+                return _inner_log_message(
                     False,
                     more_additional_data=additional_data,
                     response=response,
                 )
 
             def log_exception(additional_data: Mapping = EMPTY_DICT):
-                return log_message(True, more_additional_data=additional_data)
+                return _inner_log_message(
+                    True, more_additional_data=additional_data
+                )
 
             return log_response, log_exception
 
@@ -1,27 +1,86 @@
-import nest_asyncio
 import asyncio
+import threading
 from .general_consts import EMPTY_DICT
+from functools import lru_cache
 from inspect import iscoroutinefunction
+from typing import Optional
 from collections.abc import Mapping, Coroutine, Callable
 
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Lazily starts, only once, a persistent event loop running on a
+    daemon thread, to which coroutines can be submitted even when the
+    calling thread already runs an event loop of its own.
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="mona-openai-event-loop",
+                daemon=True,
+            ).start()
+            _background_loop = loop
+    return _background_loop
+
+
+@lru_cache(maxsize=256)
+def _is_coro(function: Callable) -> bool:
+    """
+    A cached version of inspect.iscoroutinefunction.
+
+    The same few callables (logger methods, wrapped create functions)
+    are checked over and over on every API call, and the inspect check
+    itself isn't cheap.
+    """
+    return iscoroutinefunction(function)
+
+
+def enable_uvloop() -> bool:
+    """
+    Sets uvloop as the asyncio event-loop policy, if available.
+
+    uvloop's libuv-based loop is about twice as fast as the default
+    asyncio one, which benefits the I/O-bound acreate flow with no code
+    changes - event loops created after this call (including the
+    background loop used by run_in_an_event_loop) dispatch through
+    uvloop.
+
+    uvloop is an optional dependency and isn't available on all
+    platforms (e.g., Windows), so this returns whether it was actually
+    enabled.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 def run_in_an_event_loop(coroutine: Coroutine):
     """
-    A light wrapper around asyncio.run to avoid crushing when trying to run a
-    coroutine in an environment where an event loop is already in place and
-    asyncio.run doesn't work.
+    Runs the given coroutine to completion, whether or not an event
+    loop is already running in the current thread.
+
+    When there is a running loop (an environment where asyncio.run
+    doesn't work), the coroutine is submitted to a persistent
+    background-thread loop instead of monkey-patching asyncio the way
+    nest_asyncio does, which slows down every subsequent await and
+    prevents using alternative loop implementations.
     """
     try:
-        return asyncio.run(coroutine)
+        asyncio.get_running_loop()
     except RuntimeError:
-        try:
-            return asyncio.get_event_loop().run_until_complete(coroutine)
-        except RuntimeError:
-            # This happens in environments that already have an event loop
-            # that is "run forever". We therefor must allow a "nested" event
-            # loop that we can run within the main loop.
-            nest_asyncio.apply()
-            return asyncio.run(coroutine)
+        return asyncio.run(coroutine)
+    return asyncio.run_coroutine_threadsafe(
+        coroutine, _get_background_loop()
+    ).result()
 
 
 async def call_non_blocking_sync_or_async(
@@ -32,6 +91,6 @@ async def call_non_blocking_sync_or_async(
     functions as if they were async, avoid blocking when relevant, and
     maintain one code base for both cases.
     """
-    if iscoroutinefunction(function):
+    if _is_coro(function):
         return await function(*func_args, **func_kwargs)
     return function(*func_args, **func_kwargs)
@@ -0,0 +1,4 @@
+"""
+General constants used across the package.
+"""
+EMPTY_DICT: dict = {}
@@ -0,0 +1,25 @@
+"""
+A util module for JSON serialization.
+
+Prefers orjson, which is several times faster than the stdlib json
+module and handles types like datetime and numpy scalars natively,
+while falling back to the stdlib when orjson isn't installed.
+"""
+import json
+
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        """
+        Serializes the given object to a JSON string.
+        """
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def json_dumps(obj) -> str:
+        """
+        Serializes the given object to a JSON string.
+        """
+        return json.dumps(obj)
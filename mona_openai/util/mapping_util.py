@@ -0,0 +1,27 @@
+"""
+A util module for generic mapping helpers.
+"""
+from collections.abc import Mapping
+
+
+def _freeze_value(value):
+    if isinstance(value, Mapping):
+        return tuple(
+            sorted((key, _freeze_value(val)) for key, val in value.items())
+        )
+    # Raises TypeError for unhashable values, making the whole mapping
+    # unfreezable.
+    hash(value)
+    return value
+
+
+def freeze_mapping(mapping: Mapping):
+    """
+    Returns a hashable representation of the given mapping (which may
+    contain nested mappings), usable as a cache key, or None when one
+    can't be created (e.g., for unhashable values).
+    """
+    try:
+        return _freeze_value(mapping)
+    except TypeError:
+        return None
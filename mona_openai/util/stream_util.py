@@ -33,7 +33,9 @@ class ResponseGatheringIterator:
         self._delta_choice_text_getter = delta_choice_text_getter
         self._final_choice_getter = final_choice_getter
         self._callback = callback
-        self._initial_event_recieved_time: Optional[float] = None
+        # Monotonic nanoseconds, to match the latency accounting in the
+        # monitoring logic.
+        self._initial_event_recieved_time: Optional[int] = None
         self._common_response_information: dict = {}
         self._choices: dict = {}
 
@@ -65,7 +67,7 @@ class ResponseGatheringIterator:
         this function to collect stream events.
         """
         if self._initial_event_recieved_time is None:
-            self._initial_event_recieved_time = time.time()
+            self._initial_event_recieved_time = time.monotonic_ns()
             self._common_response_information = {
                 x: event[x] for x in event if x != "choices"
             }
@@ -94,8 +96,9 @@ class ResponseGatheringIterator:
         )
 
     def _handle_choice(self, choice: dict) -> None:
-        index = choice["index"]
-        self._choices[index] = self._choices.get(index, []) + [choice]
+        # Append in place - rebuilding the list per event would make
+        # gathering a long stream quadratic in the number of events.
+        self._choices.setdefault(choice["index"], []).append(choice)
 
     def _get_only_choice(self, event: dict) -> dict:
         # Stream response events have only a single choice that specifies
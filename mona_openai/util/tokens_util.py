@@ -1,15 +1,21 @@
 """
 A utility module for everything realted to encoding tokens.
+
+NOTE: tiktoken is imported lazily to avoid paying its import time at
+package load when no stream usage calculation is ever made.
 """
-import tiktoken
+from __future__ import annotations
+
 from collections.abc import Iterable
 
 
-def _get_number_of_tokens(text: str, enc: tiktoken.Encoding) -> int:
+def _get_number_of_tokens(text: str, enc: "tiktoken.Encoding") -> int:
     return len(enc.encode(text))
 
 
-def _get_encoding(model: str) -> tiktoken.Encoding:
+def _get_encoding(model: str) -> "tiktoken.Encoding":
+    import tiktoken
+
     return tiktoken.encoding_for_model(model)
 
 
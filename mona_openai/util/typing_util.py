@@ -0,0 +1,13 @@
+"""
+A util module for type aliases used across the package.
+"""
+from typing import Union
+
+try:
+    from openai import ChatCompletion, Completion
+
+    SupportedOpenAIClassesType = Union[
+        type[ChatCompletion], type[Completion]
+    ]
+except ImportError:
+    SupportedOpenAIClassesType = type
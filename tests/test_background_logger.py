@@ -0,0 +1,93 @@
+"""
+Tests for the BackgroundLogger queued-logging decorator.
+"""
+import threading
+
+from mona_openai.loggers import BackgroundLogger, InMemoryLogger
+
+
+def test_delivery_via_flush():
+    inner = InMemoryLogger()
+    logger = BackgroundLogger(
+        inner, max_batch_size=3, max_batch_latency_seconds=0.01
+    )
+
+    for index in range(10):
+        logger.log({"index": index}, context_id=str(index))
+    logger.flush()
+
+    assert [
+        message["message"]["index"] for message in inner.latest_messages
+    ] == list(range(10))
+    assert [
+        message["context_id"] for message in inner.latest_messages
+    ] == [str(index) for index in range(10)]
+    assert logger.dropped_count == 0
+
+
+def test_drop_oldest_on_overflow():
+    writer_busy = threading.Event()
+    release_writer = threading.Event()
+
+    class BlockingLogger(InMemoryLogger):
+        def log_batch(self, entries):
+            writer_busy.set()
+            release_writer.wait()
+            super().log_batch(entries)
+
+    inner = BlockingLogger()
+    logger = BackgroundLogger(
+        inner,
+        max_queue_size=2,
+        max_batch_size=1,
+        max_batch_latency_seconds=0.01,
+    )
+
+    # Let the writer thread pick up the first message and block on it,
+    # so the queue state is fully under our control.
+    logger.log({"index": 0})
+    assert writer_busy.wait(timeout=5)
+
+    # Fill the queue, then overflow it - the oldest queued message
+    # (index 1) should be dropped in favor of the new one.
+    logger.log({"index": 1})
+    logger.log({"index": 2})
+    logger.log({"index": 3})
+    assert logger.dropped_count == 1
+
+    release_writer.set()
+    logger.flush()
+
+    assert [
+        message["message"]["index"] for message in inner.latest_messages
+    ] == [0, 2, 3]
+
+
+def test_inner_logger_exception_does_not_kill_writer():
+    class FlakyLogger(InMemoryLogger):
+        def __init__(self):
+            super().__init__()
+            self.batch_count = 0
+
+        def log_batch(self, entries):
+            self.batch_count += 1
+            if self.batch_count == 1:
+                raise RuntimeError("mock logging failure")
+            super().log_batch(entries)
+
+    inner = FlakyLogger()
+    logger = BackgroundLogger(
+        inner, max_batch_size=1, max_batch_latency_seconds=0.01
+    )
+
+    # The first batch fails inside the inner logger, but the writer
+    # thread should survive and keep handling later messages.
+    logger.log({"index": 0})
+    logger.flush()
+    logger.log({"index": 1})
+    logger.flush()
+
+    assert [
+        message["message"]["index"] for message in inner.latest_messages
+    ] == [1]
+    assert logger.dropped_count == 0
@@ -14,10 +14,13 @@ import pytest
 from openai import Completion
 
 from mona_openai.exceptions import InvalidSamplingRatioException
+from mona_openai.loggers import InMemoryLogger
 from mona_openai.mona_openai import (
     CONTEXT_ID_ARG_NAME,
     EXPORT_TIMESTAMP_ARG_NAME,
+    flush_pending_log_tasks,
     monitor,
+    monitor_with_logger,
     get_rest_monitor,
 )
 from .mocks.mock_openai import (
@@ -355,6 +358,71 @@ def test_async():
     asyncio.run(monitored_completion.acreate(**_DEFAULT_INPUT))
 
 
+def test_monitored_class_caching():
+    class CountingLogger(InMemoryLogger):
+        def __init__(self):
+            super().__init__()
+            self.start_monitoring_count = 0
+
+        def start_monitoring(self, openai_class_name):
+            self.start_monitoring_count += 1
+
+    logger = CountingLogger()
+    mock_class = _get_mock_openai_class((_DEFAULT_RESPONSE,), ())
+    specs = {"export_prompt": True}
+
+    monitored_1 = monitor_with_logger(mock_class, logger, specs)
+    monitored_2 = monitor_with_logger(mock_class, logger, specs)
+
+    # The same (class, logger, specs) combination should yield the
+    # identical cached class, with monitoring initialized only once.
+    assert monitored_1 is monitored_2
+    assert logger.start_monitoring_count == 1
+
+    # A different logger (or specs) should not hit the cache.
+    assert monitor_with_logger(mock_class, CountingLogger(), specs) is not (
+        monitored_1
+    )
+    assert (
+        monitor_with_logger(mock_class, logger, {"export_prompt": False})
+        is not monitored_1
+    )
+
+
+def test_monitored_class_caching_unhashable_specs():
+    logger = InMemoryLogger()
+    mock_class = _get_mock_openai_class((_DEFAULT_RESPONSE,), ())
+    specs = {"export_prompt": True, "unhashable": ["some", "list"]}
+
+    monitored_1 = monitor_with_logger(mock_class, logger, specs)
+    monitored_2 = monitor_with_logger(mock_class, logger, specs)
+
+    # Unhashable specs can't be cached, but monitoring should still
+    # fully work.
+    assert monitored_1 is not monitored_2
+    monitored_2.create(**_DEFAULT_INPUT)
+    assert len(logger.latest_messages) == 1
+
+
+def test_non_blocking_logging():
+    logger = InMemoryLogger()
+    monitored_completion = monitor_with_logger(
+        _get_mock_openai_class((), (_DEFAULT_RESPONSE,)),
+        logger,
+        {"non_blocking_logging": True},
+    )
+
+    async def call_and_flush():
+        await monitored_completion.acreate(**_DEFAULT_INPUT)
+        # The export should not have happened inline - only once the
+        # pending background tasks are flushed.
+        assert len(logger.latest_messages) == 0
+        await flush_pending_log_tasks()
+
+    asyncio.run(call_and_flush())
+    assert len(logger.latest_messages) == 1
+
+
 def test_exception():
     monitored_completion = monitor(
         _get_mock_openai_class((mockCreateExceptionCommand(),), ()),